@@ -6,12 +6,15 @@ when the outdoor temperature drops below the indoor temperature threshold.
 
 import argparse
 import logging
+import time
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
 from temperature_notifier.algorithm import commit_notification_sent, compare_temperatures
 from temperature_notifier.configuration import Configuration, ConfigurationError, load_configuration_from_file
+from temperature_notifier.notifications import Notification
 from temperature_notifier.notifiers import Notifier, NotifierError, create_notifiers
 from temperature_notifier.providers.influxdb import InfluxDBService, InfluxDBServiceError
 from temperature_notifier.state_manager import StateManager, StateManagerError
@@ -66,6 +69,67 @@ def configure_logging(log_name: str, debug: bool = False) -> None:
     )
 
 
+def _run_check(
+    config: Configuration,
+    influxdb_service: InfluxDBService,
+    state_manager: StateManager,
+    notifiers: list[Notifier],
+) -> None:
+    """Perform one temperature comparison and send any resulting notification.
+
+    :param config: The validated configuration.
+    :param influxdb_service: The InfluxDB temperature source.
+    :param state_manager: The state manager instance.
+    :param notifiers: The configured notifiers.
+    """
+    notification = compare_temperatures(
+        config=config,
+        temperature_source=influxdb_service,
+        state_manager=state_manager,
+    )
+    if notification is not None:
+        _send_to_all(notifiers, notification)
+        commit_notification_sent(state_manager, notification)
+
+
+def _send_to_all(notifiers: list[Notifier], notification: Notification) -> None:
+    """Send a notification through every configured notifier.
+
+    With multiple notifiers the sends run concurrently so the total wall time
+    is the slowest HTTP round-trip instead of their sum. All sends are awaited
+    before returning; if any failed, the first error is raised after the rest
+    have completed, so the notification is not recorded as sent.
+
+    :param notifiers: The configured notifiers.
+    :param notification: The notification to send.
+    :raises NotifierError: If any notifier failed to send.
+    """
+    if len(notifiers) == 1:
+        notifiers[0].send(notification)
+        return
+    with ThreadPoolExecutor(max_workers=len(notifiers)) as executor:
+        futures = [executor.submit(notifier.send, notification) for notifier in notifiers]
+    errors = [error for future in futures if (error := future.exception()) is not None]
+    if errors:
+        raise errors[0]
+
+
+def _positive_minutes(value: str) -> int:
+    """Parse a --interval value, rejecting anything below one minute.
+
+    :param value: The raw command-line value.
+    :return: The interval in minutes.
+    :raises argparse.ArgumentTypeError: If the value is not a positive integer.
+    """
+    try:
+        minutes = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'") from None
+    if minutes < 1:
+        raise argparse.ArgumentTypeError("must be a positive number of minutes")
+    return minutes
+
+
 def main(args: Sequence[str] | None = None) -> int:
     """Main function.
 
@@ -87,6 +151,13 @@ def main(args: Sequence[str] | None = None) -> int:
         action="store_true",
         help="Enable debug logging.",
     )
+    parser.add_argument(
+        "--interval",
+        type=_positive_minutes,
+        metavar="MINUTES",
+        help="Run continuously, checking every MINUTES minutes instead of exiting after one check. "
+        "Keeps the InfluxDB connection and state in memory between checks.",
+    )
     args = parser.parse_args(args)
 
     # Initialize logging
@@ -117,19 +188,25 @@ def main(args: Sequence[str] | None = None) -> int:
         # Initialize notifiers
         notifiers: list[Notifier] = create_notifiers(config)
 
-        # Perform the temperature comparison and send any resulting notification
-        notification = compare_temperatures(
-            config=config,
-            temperature_source=influxdb_service,
-            state_manager=state_manager,
-        )
-        if notification is not None:
-            for notifier in notifiers:
-                notifier.send(notification)
-            commit_notification_sent(state_manager, notification)
+        if args.interval is not None:
+            # Daemon mode: the InfluxDB connection pool, state manager, and notifiers
+            # live across ticks, so each check skips the cold-start costs of a
+            # cron-driven run (config parse, state load, TCP/DNS handshake).
+            logger.info(f"Running continuously, checking every {args.interval} minute(s).")
+            while True:
+                try:
+                    _run_check(config, influxdb_service, state_manager, notifiers)
+                except (InfluxDBServiceError, NotifierError, StateManagerError) as e:
+                    # Transient failures must not kill the daemon; retry on the next tick.
+                    logger.error(str(e))
+                time.sleep(args.interval * 60)
+        else:
+            _run_check(config, influxdb_service, state_manager, notifiers)
     except (ConfigurationError, InfluxDBServiceError, NotifierError, StateManagerError) as e:
         logger.error(str(e))
         return 1
+    except KeyboardInterrupt:
+        logger.info("Interrupted, shutting down.")
     except Exception as e:
         logger.exception(f"Unexpected error: {e}")
         return 1
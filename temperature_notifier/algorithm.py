@@ -17,7 +17,7 @@ Three distinct paths can trigger a notification:
 """
 
 import logging
-from datetime import datetime
+from datetime import datetime, time
 
 from temperature_notifier.configuration import Configuration
 from temperature_notifier.notifications import Notification, StaleSensorNotification, TemperatureNotification
@@ -35,42 +35,50 @@ def _reset_daily_state_if_new_day(state_manager: StateManager, current_datetime:
     :param current_datetime: Current datetime.
     """
     logger.info("Checking for new day...")
+    current_ordinal = current_datetime.toordinal()
     if state_manager.is_new_day(current_datetime):
         logger.info("New day detected. Resetting state.")
         state_manager.reset_daily_state()
+    elif state_manager.state.last_run_ordinal == current_ordinal:
+        # Nothing changed — skip the redundant state rewrite on this common path.
+        logger.info("No new day detected. Continuing with current state.")
+        return
     else:
         logger.info("No new day detected. Continuing with current state.")
-    state_manager.set_last_run_date(current_datetime.date())
-    state_manager.save_state()
+    state_manager.set_last_run_ordinal(current_ordinal)
 
 
 def _should_arm(
     state_manager: StateManager,
     config: Configuration,
-    current_datetime: datetime,
+    current_time: time,
 ) -> bool:
     """Determine if the notifier should arm based on the configured arming time.
 
     :param state_manager: The state manager instance.
     :param config: The configuration instance.
-    :param current_datetime: The current datetime.
+    :param current_time: The current time of day.
     :return: True if the notifier should arm now, False otherwise.
     """
     if state_manager.state.armed:
         logger.info("Notifier is already armed. No action taken.")
         return False
 
-    if current_datetime.time() >= config.arming.arming_time:
-        logger.info(
-            f"Arming notifier: current time ({current_datetime.strftime('%H:%M')}) "
-            f">= arming time ({config.arming.arming_time.strftime('%H:%M')})"
-        )
+    if current_time >= config.arming.arming_time:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Arming notifier: current time (%s) >= arming time (%s)",
+                current_time.strftime("%H:%M"),
+                config.arming.arming_time.strftime("%H:%M"),
+            )
         return True
 
-    logger.info(
-        f"Notifier not armed: current time ({current_datetime.strftime('%H:%M')}) "
-        f"is before arming time ({config.arming.arming_time.strftime('%H:%M')})"
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Notifier not armed: current time (%s) is before arming time (%s)",
+            current_time.strftime("%H:%M"),
+            config.arming.arming_time.strftime("%H:%M"),
+        )
     return False
 
 
@@ -89,17 +97,18 @@ def _handle_stale_sensors(
     :return: A StaleSensorNotification if a warning should be sent, None otherwise.
     """
     max_age = config.influxdb.max_data_age_minutes
-    logger.warning(f"Stale or missing data for sensors: {stale_msg}")
+    logger.warning("Stale or missing data for sensors: %s", stale_msg)
 
     if state_manager.is_stale_warning_sent_today(current_datetime):
         logger.info("Stale data warning already sent today, skipping notification.")
         return None
 
     if current_datetime.time() < config.arming.arming_time:
-        logger.info(
-            f"Stale data detected but before arming time ({config.arming.arming_time.strftime('%H:%M')}), "
-            "skipping notification."
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Stale data detected but before arming time (%s), skipping notification.",
+                config.arming.arming_time.strftime("%H:%M"),
+            )
         return None
 
     logger.info("Preparing stale data warning notification.")
@@ -167,7 +176,7 @@ def _handle_initial_cooling(
     trend = state_manager.outdoor_temperature_trend()
 
     if trend == TemperatureTrend.COOLING:
-        logger.info(f"Outdoor trend: {trend.value}. Notifying if outdoor < indoor.")
+        logger.info("Outdoor trend: %s. Notifying if outdoor < indoor.", trend.value)
         if outdoor_temp < indoor_temp:
             return _create_temperature_notification(indoor_temp, outdoor_temp)
         logger.info("Outdoor is not yet below indoor. No notification sent.")
@@ -175,16 +184,17 @@ def _handle_initial_cooling(
 
     min_diff = config.notification.min_temperature_difference
     if trend == TemperatureTrend.UNKNOWN:
-        logger.info(f"Outdoor trend: {trend.value} (insufficient data). Requiring delta >= {min_diff}°C.")
+        logger.info("Outdoor trend: %s (insufficient data). Requiring delta >= %s°C.", trend.value, min_diff)
     else:
-        logger.info(f"Outdoor trend: {trend.value}. Requiring delta >= {min_diff}°C.")
+        logger.info("Outdoor trend: %s. Requiring delta >= %s°C.", trend.value, min_diff)
 
     if indoor_temp - outdoor_temp >= min_diff:
         return _create_temperature_notification(indoor_temp, outdoor_temp)
 
     logger.info(
-        f"Outdoor is not {min_diff}°C below indoor "
-        f"(delta={indoor_temp - outdoor_temp:.2f}°C). No notification sent."
+        "Outdoor is not %s°C below indoor (delta=%.2f°C). No notification sent.",
+        min_diff,
+        indoor_temp - outdoor_temp,
     )
     return None
 
@@ -213,14 +223,15 @@ def _handle_rapid_change_renotification(
     :param indoor_temp: Current indoor temperature used as the minimum peak threshold.
     :return: True if a rapid change event was detected and already handled (caller should abort).
     """
-    min_peak = config.notification.rapid_change_event.min_peak_temperature
+    rapid_change_cfg = config.notification.rapid_change_event
+    min_peak = rapid_change_cfg.min_peak_temperature
     if min_peak is None:
         min_peak = indoor_temp
 
     logger.info("Checking for a rapid change event...")
     if not state_manager.has_rolling_window_rapid_change_event(
-        config.notification.rapid_change_event.rise,
-        config.notification.rapid_change_event.drop,
+        rapid_change_cfg.rise,
+        rapid_change_cfg.drop,
         min_peak_temperature=min_peak,
     ):
         logger.info("No rapid change event detected.")
@@ -233,7 +244,6 @@ def _handle_rapid_change_renotification(
     logger.info("Rapid change event detected. Resetting last notification time.")
     state_manager.record_significant_rise(current_datetime)
     state_manager.reset_notification_time()
-    state_manager.save_state()
     return False
 
 
@@ -263,12 +273,15 @@ def _handle_slow_cycle_renotification(
     """
     if state_manager.has_previous_notification():
         logger.info("Checking slow-cycle re-notification conditions...")
-        if state_manager.is_notification_in_cooldown(current_datetime, config.notification.reenable.cooldown_minutes):
+        reenable_cfg = config.notification.reenable
+        if state_manager.is_notification_in_cooldown(current_datetime, reenable_cfg.cooldown_minutes):
             logger.info("Notification is in cooldown period. No notification sent.")
             return None
-        min_rise = config.notification.reenable.min_rise_between_notifications
+        min_rise = reenable_cfg.min_rise_between_notifications
         if not state_manager.has_min_rise_since_last_notification(min_rise):
-            logger.info(f"Insufficient temperature rise ({min_rise}°C) since last notification. No notification sent.")
+            logger.info(
+                "Insufficient temperature rise (%s°C) since last notification. No notification sent.", min_rise
+            )
             return None
 
     logger.info("Comparing outdoor and indoor temperatures...")
@@ -291,52 +304,71 @@ def compare_temperatures(
     :raises InfluxDBServiceError: If there is an error fetching temperature data from InfluxDB.
     :raises StateManagerError: If there is an error managing the state.
     """
+    # All state mutations of a run are flushed in one write at the end instead of
+    # saving after each mutation; save_state() is a no-op when nothing changed.
+    try:
+        return _compare_temperatures(config, temperature_source, state_manager)
+    finally:
+        state_manager.save_state()
+
+
+def _compare_temperatures(
+    config: Configuration,
+    temperature_source: TemperatureSource,
+    state_manager: StateManager,
+) -> Notification | None:
+    """Run the comparison without flushing state; see ``compare_temperatures``.
+
+    :param config: The configuration instance.
+    :param temperature_source: The temperature data source.
+    :param state_manager: The state manager instance to manage the notifier state.
+    :return: A Notification if one should be sent, None otherwise.
+    """
     current_datetime = datetime.now()
     _reset_daily_state_if_new_day(state_manager, current_datetime)
 
     logger.info("Fetching indoor and outdoor temperatures from InfluxDB...")
+    measurements = config.influxdb.measurements
     max_age = config.influxdb.max_data_age_minutes
-    indoor_temp = temperature_source.get_last_value(
-        config.influxdb.measurements.indoor.name,
-        config.influxdb.measurements.indoor.field,
-        max_age_minutes=max_age,
-    )
-    outdoor_temp = temperature_source.get_last_value(
-        config.influxdb.measurements.outdoor.name,
-        config.influxdb.measurements.outdoor.field,
+    indoor_temp, outdoor_temp = temperature_source.get_last_values(
+        [
+            (measurements.indoor.name, measurements.indoor.field),
+            (measurements.outdoor.name, measurements.outdoor.field),
+        ],
         max_age_minutes=max_age,
     )
 
     if indoor_temp is None or outdoor_temp is None:
         stale_sensors = []
         if indoor_temp is None:
-            stale_sensors.append(f"indoor ({config.influxdb.measurements.indoor.name})")
+            stale_sensors.append(f"indoor ({measurements.indoor.name})")
         if outdoor_temp is None:
-            stale_sensors.append(f"outdoor ({config.influxdb.measurements.outdoor.name})")
+            stale_sensors.append(f"outdoor ({measurements.outdoor.name})")
         return _handle_stale_sensors(state_manager, config, current_datetime, ", ".join(stale_sensors))
 
-    logger.info(f"Indoor temperature: {indoor_temp}°C, Outdoor temperature: {outdoor_temp}°C")
+    logger.info("Indoor temperature: %s°C, Outdoor temperature: %s°C", indoor_temp, outdoor_temp)
 
     logger.debug("Updating rolling window and temps since last notification...")
     state_manager.record_outdoor_temperature(current_datetime, outdoor_temp)
-    state_manager.save_state()
 
     logger.info("Checking if indoor temperature is below the threshold...")
-    if indoor_temp <= config.notification.min_indoor_temperature:
+    min_indoor_temp = config.notification.min_indoor_temperature
+    if indoor_temp <= min_indoor_temp:
         logger.info(
-            f"Indoor temperature ({indoor_temp}°C) is below the threshold "
-            f"({config.notification.min_indoor_temperature}°C). No notification sent."
+            "Indoor temperature (%s°C) is below the threshold (%s°C). No notification sent.",
+            indoor_temp,
+            min_indoor_temp,
         )
         return None
     logger.info(
-        f"Indoor temperature ({indoor_temp}°C) is above the threshold "
-        f"({config.notification.min_indoor_temperature}°C). Proceeding with notification checks."
+        "Indoor temperature (%s°C) is above the threshold (%s°C). Proceeding with notification checks.",
+        indoor_temp,
+        min_indoor_temp,
     )
 
     logger.info("Checking if notifier should be armed...")
-    if _should_arm(state_manager, config, current_datetime):
+    if _should_arm(state_manager, config, current_datetime.time()):
         state_manager.set_armed(True)
-        state_manager.save_state()
 
     if not state_manager.is_armed():
         logger.info("Notifier is not armed. No notification sent.")
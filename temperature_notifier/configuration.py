@@ -1,36 +1,51 @@
 """Configuration module for the temperature notifier application.
 
 Defines the configuration models and the function to load configuration from a YAML file.
+Validation logic is compiled once per model class at import time (by pydantic), so each
+``load_configuration_from_file`` call only pays for the actual data validation.
 """
 
 import logging
+import pickle
 from datetime import time
 from pathlib import Path
 from typing import Annotated, Literal, Union
 
 import yaml
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+try:
+    # libyaml-backed loader; parses several times faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 logger = logging.getLogger(__name__)
 
 _MAX_PORT = 65535
 
 
-class MeasurementConfiguration(BaseModel):
+class _FrozenModel(BaseModel):
+    """Base for all configuration models: immutable and hashable after validation."""
+
+    model_config = ConfigDict(frozen=True)
+
+
+class MeasurementConfiguration(_FrozenModel):
     """InfluxDB measurement name and field."""
 
     name: str
     field: str
 
 
-class MeasurementsConfiguration(BaseModel):
+class MeasurementsConfiguration(_FrozenModel):
     """Indoor and outdoor measurement configuration."""
 
     indoor: MeasurementConfiguration
     outdoor: MeasurementConfiguration
 
 
-class InfluxDBConfiguration(BaseModel):
+class InfluxDBConfiguration(_FrozenModel):
     """InfluxDB connection and measurement configuration."""
 
     host: str
@@ -40,14 +55,14 @@ class InfluxDBConfiguration(BaseModel):
     measurements: MeasurementsConfiguration
 
 
-class SimplePushConfiguration(BaseModel):
+class SimplePushConfiguration(_FrozenModel):
     """Configuration for the SimplePush notifier."""
 
     type: Literal["simplepush"]
     key: str
 
 
-class HomeAssistantConfiguration(BaseModel):
+class HomeAssistantConfiguration(_FrozenModel):
     """Configuration for the Home Assistant notifier."""
 
     type: Literal["home_assistant"]
@@ -56,7 +71,7 @@ class HomeAssistantConfiguration(BaseModel):
     service: str = "persistent_notification/create"
 
 
-class RapidChangeEventConfiguration(BaseModel):
+class RapidChangeEventConfiguration(_FrozenModel):
     """Configuration for rapid outdoor temperature change detection."""
 
     rise: float
@@ -65,14 +80,14 @@ class RapidChangeEventConfiguration(BaseModel):
     min_peak_temperature: float | None = None
 
 
-class ReenableConfiguration(BaseModel):
+class ReenableConfiguration(_FrozenModel):
     """Configuration for re-enabling notifications after a cooldown."""
 
     cooldown_minutes: int = Field(ge=0)
     min_rise_between_notifications: float = Field(ge=0)
 
 
-class NotificationConfiguration(BaseModel):
+class NotificationConfiguration(_FrozenModel):
     """Notification thresholds and re-enable settings."""
 
     min_indoor_temperature: float
@@ -81,7 +96,7 @@ class NotificationConfiguration(BaseModel):
     reenable: ReenableConfiguration
 
 
-class ArmingConfiguration(BaseModel):
+class ArmingConfiguration(_FrozenModel):
     """Conditions that must be met before the notifier arms itself."""
 
     arming_time: time = Field(alias="time")
@@ -93,13 +108,13 @@ class ArmingConfiguration(BaseModel):
         if isinstance(v, time):
             return v
         try:
-            hours, minutes = map(int, v.split(":"))
-            return time(hour=hours, minute=minutes)
-        except Exception as e:
+            # Parses and validates in a single C call instead of split + int conversion
+            return time.fromisoformat(v)
+        except (TypeError, ValueError) as e:
             raise ValueError(f"Invalid time format '{v}'. Expected 'HH:MM'.") from e
 
 
-class Configuration(BaseModel):
+class Configuration(_FrozenModel):
     """Top-level configuration."""
 
     influxdb: InfluxDBConfiguration
@@ -114,23 +129,81 @@ class ConfigurationError(Exception):
     """Raised when the configuration file cannot be loaded or is invalid."""
 
 
+def _load_cached_configuration(cache_file: Path, source_key: tuple[int, int]) -> Configuration | None:
+    """Load a previously validated configuration from the pickle cache.
+
+    A cache hit means the source file is byte-identical to the one that produced
+    the cached entry, so validation was already done and is safely skipped.
+
+    :param cache_file: Path to the cache file.
+    :param source_key: (mtime_ns, size) of the source file the cached entry must match.
+    :return: The cached Configuration, or None if the cache is missing, stale, or unreadable.
+    """
+    try:
+        with open(cache_file, "rb") as f:
+            cached_key, config = pickle.load(f)
+    except Exception:
+        # The cache is best effort: whatever is wrong with it (unreadable file,
+        # truncated/foreign pickle, classes renamed since it was written), the
+        # answer is the same — ignore it and re-parse the source file.
+        return None
+    if cached_key != source_key or not isinstance(config, Configuration):
+        return None
+    return config
+
+
+def _write_configuration_cache(cache_file: Path, source_key: tuple[int, int], config: Configuration) -> None:
+    """Write the validated configuration to the pickle cache (best effort).
+
+    :param cache_file: Path to the cache file.
+    :param source_key: (mtime_ns, size) of the source configuration file.
+    :param config: The validated configuration to cache.
+    """
+    try:
+        with open(cache_file, "wb") as f:
+            pickle.dump((source_key, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        logger.debug(f"Failed to write configuration cache '{cache_file}': {e}")
+
+
 def load_configuration_from_file(config_file: Path) -> Configuration:
     """Load and validate configuration from a YAML file.
 
+    A pickle cache keyed on the config file's mtime and size skips the YAML parse
+    and validation on warm runs; a hit means the file is unchanged since a
+    successful validated load, so re-validation would be redundant. The cache is
+    rebuilt whenever the file changes.
+
     :param config_file: Path to the YAML configuration file.
     :return: Validated Configuration object.
     :raises ConfigurationError: If the file is missing, unparseable, or invalid.
     """
     logger.debug(f"Loading configuration from '{config_file}'...")
     try:
-        with open(config_file) as f:
-            data = yaml.safe_load(f)
+        stat = config_file.stat()
+    except FileNotFoundError as e:
+        raise ConfigurationError(e) from e
+    source_key = (stat.st_mtime_ns, stat.st_size)
+
+    cache_file = config_file.with_suffix(".cache.pkl")
+    config = _load_cached_configuration(cache_file, source_key)
+    if config is not None:
+        logger.debug("Configuration loaded from cache.")
+        return config
+
+    try:
+        # Read the file in one pass and hand the bytes straight to the parser,
+        # avoiding the incremental text-mode stream decoding of yaml.load(f)
+        data = yaml.load(config_file.read_bytes(), Loader=_YamlLoader)
     except FileNotFoundError as e:
         raise ConfigurationError(e) from e
     except yaml.YAMLError as e:
         raise ConfigurationError(f"Failed to parse configuration file: {e}") from e
 
     try:
-        return Configuration.model_validate(data)
+        config = Configuration.model_validate(data)
     except Exception as e:
         raise ConfigurationError(f"Configuration validation error: {e}") from e
+
+    _write_configuration_cache(cache_file, source_key, config)
+    return config
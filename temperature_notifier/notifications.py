@@ -3,12 +3,12 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Notification:
     """Base class for all notification types."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TemperatureNotification(Notification):
     """Emitted when outdoor temperature drops below indoor temperature.
 
@@ -20,7 +20,7 @@ class TemperatureNotification(Notification):
     outdoor_temp: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StaleSensorNotification(Notification):
     """Emitted when one or more sensors have not reported recent data.
 
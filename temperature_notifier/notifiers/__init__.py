@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 from typing import TYPE_CHECKING
 
@@ -18,27 +19,40 @@ logger = logging.getLogger(__name__)
 __all__ = ["Notifier", "NotifierError", "create_notifiers"]
 
 
+@functools.singledispatch
+def _build_notifier(notifier_config: object) -> Notifier:
+    """Build the notifier for a configuration object; dispatches on its type.
+
+    :param notifier_config: A notifier configuration instance.
+    :return: The configured notifier.
+    :raises NotifierError: If no notifier is registered for the configuration type.
+    """
+    raise NotifierError(f"Unsupported notifier configuration: {type(notifier_config).__name__}")
+
+
+@_build_notifier.register
+def _(notifier_config: SimplePushConfiguration) -> Notifier:
+    return SimplePushNotifier(key=notifier_config.key)
+
+
+@_build_notifier.register
+def _(notifier_config: HomeAssistantConfiguration) -> Notifier:
+    return HomeAssistantNotifier(
+        url=notifier_config.url,
+        token=notifier_config.token,
+        service=notifier_config.service,
+    )
+
+
 def create_notifiers(config: Configuration) -> list[Notifier]:
     """Instantiate notifiers from the validated configuration.
 
     To add a new notifier type, add its configuration class with the appropriate
-    ``type`` Literal, extend the union in ``Configuration.notifiers``, and add a
-    corresponding branch here.
+    ``type`` Literal, extend the union in ``Configuration.notifiers``, and register
+    a ``_build_notifier`` overload for it.
 
     :param config: The validated top-level configuration.
     :return: List of configured notifier instances.
     :raises NotifierError: If an unsupported notifier type is encountered.
     """
-    notifiers: list[Notifier] = []
-    for notifier_config in config.notifiers:
-        if isinstance(notifier_config, SimplePushConfiguration):
-            notifiers.append(SimplePushNotifier(key=notifier_config.key))
-        elif isinstance(notifier_config, HomeAssistantConfiguration):
-            notifiers.append(HomeAssistantNotifier(
-                url=notifier_config.url,
-                token=notifier_config.token,
-                service=notifier_config.service,
-            ))
-        else:
-            raise NotifierError(f"Unsupported notifier type: {notifier_config.type!r}")
-    return notifiers
+    return [_build_notifier(notifier_config) for notifier_config in config.notifiers]
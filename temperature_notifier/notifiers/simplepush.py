@@ -1,6 +1,7 @@
 """SimplePush notifier implementation."""
 
 import logging
+import time
 
 import requests
 from simplepush import (
@@ -15,6 +16,9 @@ from temperature_notifier.notifiers.base import Notifier, NotifierError
 
 logger = logging.getLogger(__name__)
 
+_MAX_ATTEMPTS = 3
+_INITIAL_BACKOFF_SECONDS = 0.5
+
 
 class SimplePushNotifier(Notifier):
     """Notifier that delivers notifications via the SimplePush service."""
@@ -26,31 +30,52 @@ class SimplePushNotifier(Notifier):
         """
         self.key = key
 
+    def _send_with_retry(self, message: str, title: str) -> None:
+        """Send a message via SimplePush, retrying transient failures with backoff.
+
+        Only network errors and unexpected server responses are retried; errors
+        that will not go away on their own (bad request, rate limit) propagate
+        immediately.
+
+        :param message: The notification message body.
+        :param title: The notification title.
+        """
+        backoff = _INITIAL_BACKOFF_SECONDS
+        for attempt in range(1, _MAX_ATTEMPTS + 1):
+            try:
+                send_simplepush(self.key, message, title)
+                return
+            except (UnknownError, requests.RequestException) as e:
+                if attempt == _MAX_ATTEMPTS:
+                    raise
+                logger.warning(
+                    f"SimplePush send failed (attempt {attempt}/{_MAX_ATTEMPTS}): {e}. "
+                    f"Retrying in {backoff:.1f}s..."
+                )
+                time.sleep(backoff)
+                backoff *= 2
+
     def send(self, notification: Notification) -> None:
         """Send a notification via SimplePush.
 
         :param notification: The notification to send.
         :raises NotifierError: If sending the notification fails.
         """
+        if isinstance(notification, TemperatureNotification):
+            message = f"Outdoor {notification.outdoor_temp}°C < indoor {notification.indoor_temp}°C"
+            title = "Temperature Alert"
+        elif isinstance(notification, StaleSensorNotification):
+            message = (
+                f"No recent data (>{notification.max_age_minutes} min) for sensor(s): {notification.sensors}. "
+                "Temperature monitoring paused."
+            )
+            title = "Sensor Data Warning"
+        else:
+            raise NotifierError(f"Unsupported notification type: {type(notification)}")
+
         try:
-            if isinstance(notification, TemperatureNotification):
-                send_simplepush(
-                    self.key,
-                    f"Outdoor {notification.outdoor_temp}°C < indoor {notification.indoor_temp}°C",
-                    "Temperature Alert",
-                )
-            elif isinstance(notification, StaleSensorNotification):
-                send_simplepush(
-                    self.key,
-                    f"No recent data (>{notification.max_age_minutes} min) for sensor(s): {notification.sensors}. "
-                    "Temperature monitoring paused.",
-                    "Sensor Data Warning",
-                )
-            else:
-                raise NotifierError(f"Unsupported notification type: {type(notification)}")
+            self._send_with_retry(message, title)
             logger.info("Notification sent successfully.")
-        except NotifierError:
-            raise
         except RateLimitExceeded:
             raise NotifierError("SimplePush rate limit exceeded") from None
         except BadRequest:
@@ -1,6 +1,7 @@
 """Temperature data provider package."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 
 class TemperatureSource(ABC):
@@ -15,3 +16,17 @@ class TemperatureSource(ABC):
         :param max_age_minutes: If set, only return data newer than this many minutes.
         :return: The last value, or None if unavailable or stale.
         """
+
+    def get_last_values(
+        self, measurements: Sequence[tuple[str, str]], max_age_minutes: int | None = None
+    ) -> list[float | None]:
+        """Return the most recent value for each of the given measurements.
+
+        Sources that can fetch multiple measurements in a single round trip should
+        override this; the default fetches them one by one.
+
+        :param measurements: Sequence of (measurement name, field name) pairs.
+        :param max_age_minutes: If set, only return data newer than this many minutes.
+        :return: The last value per measurement, in input order; None if unavailable or stale.
+        """
+        return [self.get_last_value(name, field, max_age_minutes=max_age_minutes) for name, field in measurements]
@@ -1,6 +1,7 @@
 """InfluxDB temperature provider."""
 
 import logging
+from collections.abc import Sequence
 
 from influxdb import InfluxDBClient
 from influxdb.exceptions import InfluxDBClientError
@@ -9,17 +10,31 @@ from temperature_notifier.providers import TemperatureSource
 
 logger = logging.getLogger(__name__)
 
+_POOL_SIZE = 10  # Sockets kept alive in the underlying requests connection pool
+_RETRIES = 2  # Retries for transient connection errors before giving up
+
 
 class InfluxDBServiceError(Exception):
     """Custom exception for InfluxDBService errors."""
 
 
 class InfluxDBService(TemperatureSource):
-    """Temperature provider backed by InfluxDB."""
+    """Temperature provider backed by InfluxDB.
+
+    The underlying client keeps a connection pool with HTTP keep-alive, so all
+    queries of a run reuse a single TCP connection. Construct the service once
+    and reuse it rather than recreating it per query.
+    """
 
     def __init__(self, host: str, port: int) -> None:
         """Initialize the InfluxDB client and connect to the specified host/port."""
-        self.client = InfluxDBClient(host=host, port=port)
+        self.client = InfluxDBClient(
+            host=host,
+            port=port,
+            pool_size=_POOL_SIZE,
+            retries=_RETRIES,
+            headers={"Connection": "keep-alive"},
+        )
 
     def switch_database(self, database: str) -> None:
         """Switch to the specified database.
@@ -28,6 +43,39 @@ class InfluxDBService(TemperatureSource):
         """
         self.client.switch_database(database)
 
+    @staticmethod
+    def _build_last_value_query(name: str, field: str, max_age_minutes: int | None) -> str:
+        """Build a LAST() query for a single measurement.
+
+        :param name: Measurement name.
+        :param field: Field name within the measurement.
+        :param max_age_minutes: If set, restrict the query to data newer than this many minutes.
+        :return: The InfluxQL query string.
+        """
+        query = f'SELECT LAST("{field}") FROM "{name}"'
+        if max_age_minutes is not None:
+            query += f" WHERE time > now() - {max_age_minutes}m"
+        return query
+
+    @staticmethod
+    def _extract_last_value(result, name: str, field: str, max_age_minutes: int | None) -> float | None:
+        """Extract the last value from a query ResultSet.
+
+        :param result: ResultSet returned by the InfluxDB client.
+        :param name: Measurement name (for logging).
+        :param field: Field name (for logging).
+        :param max_age_minutes: Maximum data age (for logging).
+        :return: The last value, or None if no recent data is available.
+        """
+        points = list(result.get_points())
+        if not points:
+            logger.warning(
+                f"No recent data for measurement '{name}' field '{field}'"
+                + (f" (within last {max_age_minutes} min)" if max_age_minutes else "") + "."
+            )
+            return None
+        return points[0]["last"]
+
     def get_last_value(self, name: str, field: str, max_age_minutes: int | None = None) -> float | None:
         """Query the last value from a given measurement.
 
@@ -38,19 +86,39 @@ class InfluxDBService(TemperatureSource):
         :return: The last value from the specified measurement, or None if unavailable/stale.
         """
         try:
-            query = f'SELECT LAST("{field}") FROM "{name}"'
-            if max_age_minutes is not None:
-                query += f" WHERE time > now() - {max_age_minutes}m"
-            result = self.client.query(query)
-            points = list(result.get_points())
-            if not points:
-                logger.warning(
-                    f"No recent data for measurement '{name}' field '{field}'"
-                    + (f" (within last {max_age_minutes} min)" if max_age_minutes else "") + "."
-                )
-                return None
-            return points[0]["last"]
+            result = self.client.query(self._build_last_value_query(name, field, max_age_minutes))
+            return self._extract_last_value(result, name, field, max_age_minutes)
         except (InfluxDBClientError, ValueError) as e:
             raise InfluxDBServiceError(
                 f"Failed to query InfluxDB for measurement '{name}': {e}"
             ) from e
+
+    def get_last_values(
+        self, measurements: Sequence[tuple[str, str]], max_age_minutes: int | None = None
+    ) -> list[float | None]:
+        """Query the last values of several measurements in a single round trip.
+
+        Sends one multi-statement query (semicolon-separated) so only one HTTP
+        request/response cycle is paid regardless of the number of measurements.
+
+        :param measurements: Sequence of (measurement name, field name) pairs.
+        :param max_age_minutes: If set, only returns data newer than this many minutes.
+        :return: The last value per measurement, in input order; None if unavailable/stale.
+        """
+        multi_query = ";".join(
+            self._build_last_value_query(name, field, max_age_minutes) for name, field in measurements
+        )
+        try:
+            results = self.client.query(multi_query)
+            # The client returns a single ResultSet for one statement and a list for several.
+            if not isinstance(results, list):
+                results = [results]
+            return [
+                self._extract_last_value(result, name, field, max_age_minutes)
+                for result, (name, field) in zip(results, measurements, strict=True)
+            ]
+        except (InfluxDBClientError, ValueError) as e:
+            raise InfluxDBServiceError(
+                f"Failed to query InfluxDB for measurements "
+                f"{', '.join(repr(name) for name, _ in measurements)}: {e}"
+            ) from e
@@ -3,8 +3,8 @@
 import itertools
 import logging
 from collections import deque
-from dataclasses import asdict, dataclass
-from datetime import datetime, timedelta
+from collections.abc import Sequence
+from datetime import datetime
 from enum import Enum
 from typing import Self
 
@@ -13,6 +13,53 @@ logger = logging.getLogger(__name__)
 _MIN_WINDOW_ENTRIES = 3
 
 
+def _detect_rise_and_drop(
+    temps: Sequence[float],
+    max_index: int,
+    rise_threshold: float,
+    drop_threshold: float,
+    min_peak_temperature: float | None,
+) -> bool:
+    """Detect a significant rise followed by a significant drop in a temperature series.
+
+    Numeric kernel kept free of entry objects so the scan runs over plain floats
+    without per-element attribute lookups. The peak is supplied by the caller,
+    which tracks it incrementally across appends and evictions.
+
+    :param temps: Temperature series, oldest first.
+    :param max_index: Index of the first occurrence of the maximum in temps.
+    :param rise_threshold: The threshold for significant rise.
+    :param drop_threshold: The threshold for significant drop.
+    :param min_peak_temperature: If set, the peak temperature must exceed this value.
+    :return: True if such an event is detected, False otherwise.
+    """
+    max_value = temps[max_index]
+
+    # 1. Require the peak to have exceeded indoor temperature so that only a genuine
+    #    warm-then-cool reversal (outdoor was above indoor) triggers the event.
+    if min_peak_temperature is not None and max_value < min_peak_temperature:
+        logger.info(
+            f"Peak outdoor temperature ({max_value:.2f}°C) did not exceed indoor temperature "
+            f"({min_peak_temperature:.2f}°C). No rapid change event."
+        )
+        return False
+
+    # 2. The peak needs a valley before it (the "rise") and entries after it (the "drop")
+    if max_index == 0 or max_index == len(temps) - 1:
+        return False
+
+    # 3. Minimum before the maximum (the "rise" valley) and after it (the "drop"
+    #    valley), again as copy-free C reductions over the relevant spans.
+    min_before_max = min(itertools.islice(temps, max_index))
+    min_after_max = min(itertools.islice(temps, max_index + 1, None))
+
+    rise = max_value - min_before_max
+    drop = max_value - min_after_max
+    logger.info(f"Rise: {rise:.2f}, Drop: {drop:.2f}")
+
+    return rise >= rise_threshold and drop >= drop_threshold
+
+
 class TemperatureTrend(Enum):
     """Direction of the outdoor temperature trend over recent rolling window entries."""
 
@@ -21,34 +68,38 @@ class TemperatureTrend(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
-class RollingWindowEntry:
-    """Represents an entry in the rolling window.
+class RollingWindow:
+    """Rolling window for temperature data.
 
-    :param time: The timestamp of the entry.
-    :param temperature: The temperature value.
+    Timestamps and temperatures are stored in two parallel deques rather than a
+    deque of entry objects, so the numeric scans iterate plain floats with no
+    per-entry object overhead or attribute lookups. Timestamps are kept as epoch
+    floats internally; datetime objects only appear at the API boundary
+    (append/serialization), so the eviction loop compares plain floats.
     """
 
-    time: datetime
-    temperature: float
-
-
-class RollingWindow:
-    """Rolling window for temperature data."""
-
     def __init__(self, window_minutes: int):
         """Initialize the rolling window.
 
         :param window_minutes: The time span (in minutes) for the rolling window.
         """
         self.window_minutes = window_minutes
-        self.entries: deque[RollingWindowEntry] = deque()
+        self._window_seconds = window_minutes * 60.0
+        self._times: deque[float] = deque()
+        self._temps: deque[float] = deque()
+        # Cached index of the first occurrence of the window maximum, maintained
+        # across appends/evictions; -1 means unknown and triggers a recompute.
+        self._max_index: int = -1
+
+    def __len__(self) -> int:
+        """Return the number of entries in the rolling window."""
+        return len(self._temps)
 
     def __repr__(self) -> str:
         """Return a debug-friendly string representation of the RollingWindow."""
         return (
             f"RollingWindow(window_minutes={self.window_minutes}, "
-            f"entries={len(self.entries)} entries)"
+            f"entries={len(self._temps)} entries)"
         )
 
     def append(self, current_time: datetime, temperature: float) -> None:
@@ -59,12 +110,19 @@ class RollingWindow:
         :param current_time: The current timestamp.
         :param temperature: The temperature to add to the rolling window.
         """
-        self.entries.append(
-            RollingWindowEntry(time=current_time, temperature=temperature)
-        )
-        cutoff_time = current_time - timedelta(minutes=self.window_minutes)
-        while self.entries and self.entries[0].time < cutoff_time:
-            self.entries.popleft()
+        current_ts = current_time.timestamp()
+        self._times.append(current_ts)
+        self._temps.append(temperature)
+        # Strictly greater keeps the first occurrence on ties, matching a full scan
+        if self._max_index >= 0 and temperature > self._temps[self._max_index]:
+            self._max_index = len(self._temps) - 1
+        cutoff_ts = current_ts - self._window_seconds
+        while self._times and self._times[0] < cutoff_ts:
+            self._times.popleft()
+            self._temps.popleft()
+            # Shift the cached peak with the eviction; if the peak itself was
+            # evicted its position is unknown until the next query recomputes it.
+            self._max_index -= 1
 
     def has_significant_rise_and_drop(
         self, rise_threshold: float, drop_threshold: float, min_peak_temperature: float | None = None
@@ -80,47 +138,25 @@ class RollingWindow:
         :param min_peak_temperature: If set, the peak temperature must exceed this value.
         :return: True if such an event is detected, False otherwise.
         """
-        if not self.entries or len(self.entries) < _MIN_WINDOW_ENTRIES:
+        if len(self._temps) < _MIN_WINDOW_ENTRIES:
             return False
 
-        logger.info(
-            "Rolling window entries:\n%s",
-            "\n".join(
-                f"         {entry.time.strftime('%Y-%m-%d %H:%M:%S')}: {entry.temperature:.2f}°C"
-                for entry in self.entries
-            ),
-        )
-
-        # 1. Find the maximum value and its index (the "rise" peak)
-        max_index, max_entry = max(
-            enumerate(self.entries), key=lambda x: x[1].temperature
-        )
-        max_value = max_entry.temperature
-
-        # 2. Require the peak to have exceeded indoor temperature so that only a genuine
-        #    warm-then-cool reversal (outdoor was above indoor) triggers the event.
-        if min_peak_temperature is not None and max_value < min_peak_temperature:
+        # The multi-line dump formats every entry; skip it entirely when no
+        # handler would emit INFO records.
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
-                f"Peak outdoor temperature ({max_value:.2f}°C) did not exceed indoor temperature "
-                f"({min_peak_temperature:.2f}°C). No rapid change event."
+                "Rolling window entries:\n%s",
+                "\n".join(
+                    f"         {datetime.fromtimestamp(ts).isoformat(sep=' ', timespec='seconds')}: {temperature:.2f}°C"
+                    for ts, temperature in zip(self._times, self._temps, strict=True)
+                ),
             )
-            return False
-
-        # 3. Find the minimum value before the maximum (the "rise" valley)
-        if max_index == 0:
-            return False
-        min_before_max = min(e.temperature for e in itertools.islice(self.entries, max_index))
-
-        # 4. Look for the minimum value after the maximum (the "drop" valley)
-        if max_index == len(self.entries) - 1:
-            return False
-        min_after_max = min(e.temperature for e in itertools.islice(self.entries, max_index + 1, None))
-
-        rise = max_value - min_before_max
-        drop = max_value - min_after_max
-        logger.info(f"Rise: {rise:.2f}, Drop: {drop:.2f}")
 
-        return rise >= rise_threshold and drop >= drop_threshold
+        if self._max_index < 0:
+            self._max_index = self._temps.index(max(self._temps))
+        return _detect_rise_and_drop(
+            self._temps, self._max_index, rise_threshold, drop_threshold, min_peak_temperature
+        )
 
     def temperature_trend(self, num_entries: int = 3) -> TemperatureTrend:
         """Determine the outdoor temperature trend over the last num_entries readings.
@@ -131,9 +167,9 @@ class RollingWindow:
         :param num_entries: Number of recent entries to span the trend check.
         :return: COOLING, WARMING, or UNKNOWN.
         """
-        if len(self.entries) < num_entries:
+        if len(self._temps) < num_entries:
             return TemperatureTrend.UNKNOWN
-        if self.entries[-1].temperature < self.entries[-num_entries].temperature:
+        if self._temps[-1] < self._temps[-num_entries]:
             return TemperatureTrend.COOLING
         return TemperatureTrend.WARMING
 
@@ -143,29 +179,38 @@ class RollingWindow:
         :param timestamp: The timestamp to check.
         :return: True if the timestamp is within the rolling window, False otherwise.
         """
-        if not self.entries:
+        if not self._times:
             return False
 
-        return self.entries[0].time <= timestamp <= self.entries[-1].time
+        return self._times[0] <= timestamp.timestamp() <= self._times[-1]
+
+    def to_dict(self) -> dict[str, list[float]]:
+        """Serialize the rolling window to a JSON-ready dictionary.
 
-    def to_dict(self) -> list[dict]:
-        """Serialize the rolling window to a list of dictionaries.
+        Times are stored as epoch floats in two parallel lists, mirroring the
+        in-memory layout, so serializing and loading need no per-entry
+        datetime/ISO-string conversion.
 
-        :return: A list of dictionaries representing the rolling window.
+        :return: A dictionary with "times" and "temps" lists.
         """
-        return [asdict(entry) for entry in self.entries]
+        return {"times": list(self._times), "temps": list(self._temps)}
 
     @classmethod
-    def from_dict(cls, data: list[dict], window_minutes: int) -> Self:
-        """Deserialize a list of dictionaries into a RollingWindow object.
+    def from_dict(cls, data: dict[str, list[float]] | list[dict], window_minutes: int) -> Self:
+        """Deserialize a dictionary into a RollingWindow object.
 
-        :param data: A list of dictionaries representing the rolling window.
+        Also accepts the legacy format, a list of dicts with ISO "time" strings,
+        so state files written before the format change still load.
+
+        :param data: A dictionary with "times" and "temps" lists (or legacy list).
         :param window_minutes: The time span (in minutes) for the rolling window.
         :return: A RollingWindow object.
         """
         instance = cls(window_minutes)
-        instance.entries = deque(
-            RollingWindowEntry(time=datetime.fromisoformat(entry["time"]), temperature=entry["temperature"])
-            for entry in data
-        )
+        if isinstance(data, dict):
+            instance._times = deque(data.get("times", []))
+            instance._temps = deque(data.get("temps", []))
+        else:
+            instance._times = deque(datetime.fromisoformat(entry["time"]).timestamp() for entry in data)
+            instance._temps = deque(entry["temperature"] for entry in data)
         return instance
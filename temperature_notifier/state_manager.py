@@ -1,16 +1,23 @@
 """State management for the temperature notifier application."""
 
+import itertools
 import json
 import logging
-from dataclasses import dataclass, field
+import os
+from dataclasses import dataclass
 from datetime import date, datetime
 from pathlib import Path
 
 from .rolling_window import RollingWindow, TemperatureTrend
 
-logger = logging.getLogger(__name__)
+try:
+    # Rust-backed JSON codec; encodes straight to bytes several times faster
+    # than the stdlib module. Optional — the stdlib json is used when absent.
+    import orjson
+except ImportError:
+    orjson = None
 
-_MIN_TEMPS_FOR_RISE = 2
+logger = logging.getLogger(__name__)
 
 
 def serialize_datetime(dt: datetime) -> str:
@@ -31,7 +38,7 @@ def deserialize_datetime(dt_str: str) -> datetime:
     return datetime.fromisoformat(dt_str) if dt_str else None
 
 
-@dataclass
+@dataclass(slots=True)
 class State:
     """Represent the runtime state of the temperature notifier.
 
@@ -45,10 +52,13 @@ class State:
     last_notification_time: datetime | None = None
     last_significant_rise_time: datetime | None = None
     last_stale_warning_time: datetime | None = None
-    last_run_date: date | None = None
+    last_run_ordinal: int | None = None
     armed: bool = False
     rolling_window: RollingWindow | None = None
-    temps_since_last_notification: list[float] = field(default_factory=list)
+    # Running aggregates over the readings since the last notification; together
+    # they answer the min-rise check in O(1) without keeping the readings around.
+    min_temp_since_last_notification: float | None = None
+    max_rise_since_last_notification: float | None = None
 
 
 class StateManagerError(Exception):
@@ -66,6 +76,7 @@ class StateManager:
         """
         self.state_file = state_file
         self.state = State(rolling_window=RollingWindow(rolling_window_minutes))
+        self._dirty = False
         self.load_state()
 
     def __repr__(self) -> str:
@@ -77,66 +88,116 @@ class StateManager:
         if self.state_file.exists():
             logger.debug(f"Loading state from '{self.state_file}'...")
 
+            state = self.state
             try:
-                with open(self.state_file) as f:
-                    data = json.load(f)
-                    # Restore all state fields from the persisted dict
-                    self.state.last_notification_time = deserialize_datetime(
-                        data.get("last_notification_time")
-                    )
-                    self.state.last_significant_rise_time = deserialize_datetime(
-                        data.get("last_significant_rise_time")
-                    )
-                    self.state.last_stale_warning_time = deserialize_datetime(
-                        data.get("last_stale_warning_time")
-                    )
+                raw = self.state_file.read_bytes()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                # Restore all state fields from the persisted dict; datetime
+                # conversions are inlined conditional expressions rather than
+                # helper calls to skip a call frame per field.
+                last_notification_time = data.get("last_notification_time")
+                state.last_notification_time = (
+                    datetime.fromisoformat(last_notification_time) if last_notification_time else None
+                )
+                last_significant_rise_time = data.get("last_significant_rise_time")
+                state.last_significant_rise_time = (
+                    datetime.fromisoformat(last_significant_rise_time) if last_significant_rise_time else None
+                )
+                last_stale_warning_time = data.get("last_stale_warning_time")
+                state.last_stale_warning_time = (
+                    datetime.fromisoformat(last_stale_warning_time) if last_stale_warning_time else None
+                )
+                last_run_ordinal = data.get("last_run_ordinal")
+                if last_run_ordinal is None:
+                    # Legacy state files stored the last run date as an ISO string
                     last_run_date_str = data.get("last_run_date")
-                    self.state.last_run_date = date.fromisoformat(last_run_date_str) if last_run_date_str else None
-                    self.state.armed = data.get("armed", False)
-                    self.state.rolling_window = RollingWindow.from_dict(
-                        data.get("rolling_window", []),
-                        window_minutes=self.state.rolling_window.window_minutes,
-                    )
-                    self.state.temps_since_last_notification = data.get(
-                        "temps_since_last_notification", []
-                    )
-                    logger.debug("State loaded successfully.")
+                    if last_run_date_str:
+                        last_run_ordinal = date.fromisoformat(last_run_date_str).toordinal()
+                state.last_run_ordinal = last_run_ordinal
+                state.armed = data.get("armed", False)
+                state.rolling_window = RollingWindow.from_dict(
+                    data.get("rolling_window", []),
+                    window_minutes=state.rolling_window.window_minutes,
+                )
+                state.min_temp_since_last_notification = data.get("min_temp_since_last_notification")
+                state.max_rise_since_last_notification = data.get("max_rise_since_last_notification")
+                if state.min_temp_since_last_notification is None:
+                    # Legacy state files stored every reading since the last
+                    # notification; reduce the list to the new aggregates once.
+                    legacy_temps = data.get("temps_since_last_notification")
+                    if legacy_temps:
+                        state.min_temp_since_last_notification = legacy_temps[0]
+                        for temp in itertools.islice(legacy_temps, 1, None):
+                            rise = temp - state.min_temp_since_last_notification
+                            if state.max_rise_since_last_notification is None or (
+                                rise > state.max_rise_since_last_notification
+                            ):
+                                state.max_rise_since_last_notification = rise
+                            state.min_temp_since_last_notification = min(
+                                state.min_temp_since_last_notification, temp
+                            )
+                logger.debug("State loaded successfully.")
             except json.JSONDecodeError as e:
                 logger.warning(f"Failed to parse state file: {e}")
             except OSError as e:
                 raise StateManagerError(f"Failed to read state file: {e}") from e
 
     def save_state(self) -> None:
-        """Save the state to a file."""
+        """Save the state to a file.
+
+        No-op when the state has not been mutated since the last save, so callers
+        can flush unconditionally at the end of a run without paying for redundant
+        serializations and writes.
+        """
+        if not self._dirty:
+            logger.debug("State unchanged since last save, skipping write.")
+            return
         logger.debug(f"Saving state to '{self.state_file}'")
 
+        state = self.state
         try:
+            last_notification_time = state.last_notification_time
+            last_significant_rise_time = state.last_significant_rise_time
+            last_stale_warning_time = state.last_stale_warning_time
             state_dict = {
-                "last_notification_time": serialize_datetime(self.state.last_notification_time),
-                "last_significant_rise_time": serialize_datetime(self.state.last_significant_rise_time),
-                "last_stale_warning_time": serialize_datetime(self.state.last_stale_warning_time),
-                "last_run_date": self.state.last_run_date.isoformat() if self.state.last_run_date else None,
-                "armed": self.state.armed,
-                "rolling_window": [
-                    {"time": serialize_datetime(entry.time), "temperature": entry.temperature}
-                    for entry in self.state.rolling_window.entries
-                ],
-                "temps_since_last_notification": self.state.temps_since_last_notification,
+                "last_notification_time": (
+                    last_notification_time.isoformat() if last_notification_time else None
+                ),
+                "last_significant_rise_time": (
+                    last_significant_rise_time.isoformat() if last_significant_rise_time else None
+                ),
+                "last_stale_warning_time": (
+                    last_stale_warning_time.isoformat() if last_stale_warning_time else None
+                ),
+                "last_run_ordinal": state.last_run_ordinal,
+                "armed": state.armed,
+                "rolling_window": state.rolling_window.to_dict(),
+                "min_temp_since_last_notification": state.min_temp_since_last_notification,
+                "max_rise_since_last_notification": state.max_rise_since_last_notification,
             }
-            with open(self.state_file, "w") as f:
-                json.dump(state_dict, f, indent=4)
+            if orjson is not None:
+                payload = orjson.dumps(state_dict, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(state_dict, indent=4).encode()
+            # Write to a sibling temp file and rename over the target so a crash
+            # mid-write can never leave a truncated state file behind.
+            tmp_file = self.state_file.with_suffix(".tmp")
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, self.state_file)
+            self._dirty = False
             logger.debug("State saved successfully.")
         except OSError as e:
             logger.warning(f"Failed to write state file: {e}")
 
     def is_new_day(self, current_datetime: datetime) -> bool:
-        """Check if a new day has started based on the last run date.
+        """Check if a new day has started based on the last run day.
 
-        :param current_datetime: The current time to compare against the last run date.
+        :param current_datetime: The current time to compare against the last run day.
         :return: True if a new day has started, False otherwise.
         """
-        if self.state.last_run_date is not None:
-            return self.state.last_run_date != current_datetime.date()
+        if self.state.last_run_ordinal is not None:
+            # Plain integer compare; no date object needs to be constructed
+            return self.state.last_run_ordinal != current_datetime.toordinal()
         return False
 
     def is_armed(self) -> bool:
@@ -152,11 +213,13 @@ class StateManager:
         :param armed: Whether the notifier should be armed.
         """
         self.state.armed = armed
+        self._dirty = True
         logger.info(f"Notifier armed state set to {armed}.")
 
     def reset_notification_time(self) -> None:
         """Reset the notification time to allow a new notification."""
         self.state.last_notification_time = None
+        self._dirty = True
         logger.info("Notification time reset.")
 
     def reset_daily_state(self) -> None:
@@ -164,11 +227,14 @@ class StateManager:
 
         Called at the start of each new day.
         """
-        self.state.last_notification_time = None
-        self.state.last_significant_rise_time = None
-        self.state.last_stale_warning_time = None
-        self.state.armed = False
-        self.state.temps_since_last_notification = []
+        state = self.state
+        state.last_notification_time = None
+        state.last_significant_rise_time = None
+        state.last_stale_warning_time = None
+        state.armed = False
+        state.min_temp_since_last_notification = None
+        state.max_rise_since_last_notification = None
+        self._dirty = True
         logger.info("Daily state reset: armed=False, notification times cleared, temps cleared.")
 
     def is_notification_in_cooldown(
@@ -233,16 +299,23 @@ class StateManager:
         :param current_datetime: The current datetime.
         :return: True if a stale warning was already sent today, False otherwise.
         """
-        if self.state.last_stale_warning_time is None:
+        last_time = self.state.last_stale_warning_time
+        if last_time is None:
             return False
-        return self.state.last_stale_warning_time.date() == current_datetime.date()
+        # Attribute compares instead of .date(), which would allocate two date objects
+        return (
+            last_time.year == current_datetime.year
+            and last_time.month == current_datetime.month
+            and last_time.day == current_datetime.day
+        )
 
-    def set_last_run_date(self, current_date: date) -> None:
-        """Set the last run date.
+    def set_last_run_ordinal(self, ordinal: int) -> None:
+        """Set the last run day.
 
-        :param current_date: The date to record as the last run date.
+        :param ordinal: The proleptic Gregorian ordinal of the last run day.
         """
-        self.state.last_run_date = current_date
+        self.state.last_run_ordinal = ordinal
+        self._dirty = True
 
     def record_outdoor_temperature(self, current_datetime: datetime, outdoor_temp: float) -> None:
         """Append an outdoor temperature reading to the rolling window and temps buffer.
@@ -250,8 +323,19 @@ class StateManager:
         :param current_datetime: Timestamp of the reading.
         :param outdoor_temp: Outdoor temperature in °C.
         """
-        self.state.rolling_window.append(current_datetime, outdoor_temp)
-        self.state.temps_since_last_notification.append(outdoor_temp)
+        state = self.state
+        state.rolling_window.append(current_datetime, outdoor_temp)
+        # Fold the reading into the running aggregates: the rise is measured
+        # against the minimum of all earlier readings, then the minimum absorbs
+        # the new reading.
+        min_temp = state.min_temp_since_last_notification
+        if min_temp is None or outdoor_temp < min_temp:
+            state.min_temp_since_last_notification = outdoor_temp
+        else:
+            rise = outdoor_temp - min_temp
+            if state.max_rise_since_last_notification is None or rise > state.max_rise_since_last_notification:
+                state.max_rise_since_last_notification = rise
+        self._dirty = True
 
     def outdoor_temperature_trend(self) -> TemperatureTrend:
         """Return the current outdoor temperature trend from the rolling window.
@@ -273,7 +357,9 @@ class StateManager:
         :param current_datetime: The datetime when the notification was sent.
         """
         self.state.last_notification_time = current_datetime
-        self.state.temps_since_last_notification.clear()
+        self.state.min_temp_since_last_notification = None
+        self.state.max_rise_since_last_notification = None
+        self._dirty = True
 
     def record_stale_warning_sent(self, current_datetime: datetime) -> None:
         """Record that a stale-data warning notification was sent.
@@ -281,6 +367,7 @@ class StateManager:
         :param current_datetime: The datetime when the warning was sent.
         """
         self.state.last_stale_warning_time = current_datetime
+        self._dirty = True
 
     def record_significant_rise(self, current_datetime: datetime) -> None:
         """Record the time of a significant outdoor temperature rise event.
@@ -288,6 +375,7 @@ class StateManager:
         :param current_datetime: The datetime of the significant rise.
         """
         self.state.last_significant_rise_time = current_datetime
+        self._dirty = True
 
     def has_min_rise_since_last_notification(self, min_rise: float) -> bool:
         """Check if there has been a minimum temperature rise since the last notification.
@@ -295,22 +383,16 @@ class StateManager:
         :param min_rise: The minimum temperature rise required to trigger a notification.
         :return: True if there has been a sufficient rise, False otherwise.
         """
-        temps = self.state.temps_since_last_notification
-        if len(temps) < _MIN_TEMPS_FOR_RISE:
+        max_rise = self.state.max_rise_since_last_notification
+        if max_rise is None:
+            # Fewer than two readings since the last notification
             return False
 
-        # Walk through recorded temperatures tracking the running minimum.
-        # Return True as soon as any later reading exceeds the minimum by at least min_rise.
-        min_temp = temps[0]
-        for temp in temps[1:]:
-            if temp - min_temp >= min_rise:
-                logger.debug(
-                    f"Detected temperature rise: {temp:.2f}°C - {min_temp:.2f}°C"
-                    f" = {temp - min_temp:.2f}°C >= {min_rise:.2f}°C"
-                )
-                return True
-            # Keep the lowest value seen so far as the baseline for the next rise check
-            min_temp = min(min_temp, temp)
+        if max_rise >= min_rise:
+            logger.debug(f"Detected temperature rise: {max_rise:.2f}°C >= {min_rise:.2f}°C")
+            return True
 
-        logger.debug(f"No significant rise detected in temperatures since last notification: {temps}")
+        logger.debug(
+            f"No significant rise since last notification: max rise {max_rise:.2f}°C < {min_rise:.2f}°C"
+        )
         return False